@@ -1,18 +1,34 @@
 """
 Google Classroom Manager - Enhanced system for working with Google Classroom API
 """
-from datetime import datetime, timezone, timedelta
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
+import httplib2
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.errors import HttpError
 from googleapiclient.discovery import build
+from googleapiclient.http import set_user_agent
+from googleapiclient.model import JsonModel
 
+from fileprocessor import _dumps, _loads
 from logger import logger
 
-SCOPES = [
+SCOPES = (
     "https://www.googleapis.com/auth/classroom.rosters",
     "https://www.googleapis.com/auth/classroom.profile.emails",
     "https://www.googleapis.com/auth/classroom.profile.photos",
@@ -22,22 +38,151 @@ SCOPES = [
     "https://www.googleapis.com/auth/classroom.topics",
     "https://www.googleapis.com/auth/classroom.announcements",
     "https://www.googleapis.com/auth/calendar",
-]
+)
+_SCOPE_SET = frozenset(SCOPES)
+
+# Google APIs serve gzip-compressed responses only when the User-Agent contains "gzip"
+USER_AGENT = "google-classroom-api (gzip)"
+
+# Maximum number of calls allowed in one batch request by the Classroom API
+BATCH_LIMIT = 50
+
+# Seconds before expiry when the background refresher renews the token
+REFRESH_MARGIN = 300
+# Shortest wait between background refreshes, for tokens living less than REFRESH_MARGIN
+MIN_REFRESH_INTERVAL = 60
+
+# Retries with exponential backoff for 429/5xx responses and connection errors
+NUM_RETRIES = 5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound of a single backoff delay, seconds
+MAX_RETRY_DELAY = 64
+# Socket timeout of HTTP clients, seconds
+HTTP_TIMEOUT = 30
+
+# Default number of worker threads for parallel API calls
+MAX_WORKERS = 10
+
+# Local copies of the course list, one per account, reused by new processes while fresh
+COURSES_CACHE_DIR = Path.home() / ".cache" / "gcroom"
+COURSES_CACHE_TTL = 900
+# Course fields needed for lookups by id, name and section; only such lists are cached
+COURSE_FIELDS = "id,name,section"
+
+# Credentials loaded from token.json, reused while the file is unchanged
+_CREDS_CACHE = {"creds": None, "mtime": None, "refresher": None}
+# Per-thread HTTP clients, see _thread_http
+_THREAD_LOCAL = threading.local()
+# Serializes token loading/refreshing between API callers and the refresher
+_CREDS_LOCK = threading.Lock()
+# Fetches next pages in iter_pages; its thread keeps its HTTP client between calls
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gcroom-prefetch")
+
+
+def _expires_within(creds, seconds: int) -> bool:
+    """Check whether credentials expire within the given number of seconds"""
+    if not creds.expiry:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds() < seconds
+
+
+def _save_token(creds, token_file: Path) -> None:
+    """Write credentials to token file and remember its new mtime"""
+    with open(token_file, "w") as token:
+        token.write(creds.to_json())
+    _CREDS_CACHE["creds"] = creds
+    _CREDS_CACHE["mtime"] = token_file.stat().st_mtime
+    logger.info("Tokens saved")
+
+
+class _TokenRefresher:
+    """Refresh credentials in a daemon thread shortly before they expire"""
+
+    def __init__(self, creds, token_file: Path, margin: int = REFRESH_MARGIN):
+        self.creds = creds
+        self.token_file = token_file
+        self.margin = margin
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _seconds_to_refresh(self) -> float:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (self.creds.expiry - now).total_seconds() - self.margin
+
+    def _loop(self) -> None:
+        while not self._stop.wait(max(self._seconds_to_refresh(), MIN_REFRESH_INTERVAL)):
+            try:
+                with _CREDS_LOCK:
+                    if _expires_within(self.creds, self.margin):
+                        self.creds.refresh(Request())
+                        _save_token(self.creds, self.token_file)
+                        logger.info("🔄 Tokens refreshed in background")
+            except Exception as e:
+                logger.error("❌ Error refreshing tokens in background: %s", e)
+                # Retry later instead of spinning on a failing refresh
+                if self._stop.wait(60):
+                    return
+
+
+def _start_refresher(creds, token_file: Path) -> None:
+    """Start background refresher once per credentials object"""
+    refresher = _CREDS_CACHE["refresher"]
+    if refresher is not None and refresher.creds is creds:
+        return
+    if refresher is not None:
+        refresher.stop()
+    if creds.refresh_token and creds.expiry:
+        _CREDS_CACHE["refresher"] = _TokenRefresher(creds, token_file)
 
 
 def authenticate():
+    with _CREDS_LOCK:
+        return _authenticate()
+
+
+def _authenticate():
     creds = False
-    expired = False
     my_dir = Path(__file__).parent
     token_file = my_dir / "token.json"
     credentials_file = my_dir / "client_secret.json"
     # Авторизація користувача
     if token_file.exists():
-        creds = Credentials.from_authorized_user_file(token_file, SCOPES)
-    if creds:
-        expired = creds.expiry.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc) < timedelta(seconds=60)
-    if not creds or creds.expired or expired:
+        mtime = token_file.stat().st_mtime
+        cached = _CREDS_CACHE["creds"]
+        # Cached creds passed the scope check below when token.json was loaded
+        if cached is not None and _CREDS_CACHE["mtime"] == mtime:
+            if cached.valid and not _expires_within(cached, 60):
+                return cached
+            creds = cached
+        else:
+            with open(token_file, "r") as token:
+                info = json.load(token)
+            # Scopes granted to the saved token; creds built from it carry SCOPES
+            granted = info.get("scopes") or ()
+            if isinstance(granted, str):
+                granted = granted.split()
+            if _SCOPE_SET.issubset(granted):
+                creds = Credentials.from_authorized_user_info(info, SCOPES)
+            else:
+                logger.info("Saved tokens lack required scopes")
+    if creds and creds.refresh_token and (creds.expired or _expires_within(creds, 60)):
         logger.info("Refreshing tokens...")
+        token_before = creds.token
+        try:
+            creds.refresh(Request())
+            if creds.token != token_before:
+                _save_token(creds, token_file)
+        except Exception as e:
+            logger.warning("⚠️ Silent token refresh failed: %s", e)
+            creds = False
+    if not creds or creds.expired or _expires_within(creds, 60):
+        logger.info("Requesting new tokens...")
         if not credentials_file.exists():
             raise FileNotFoundError(f"Credentials file not found: {credentials_file}")
 
@@ -45,78 +190,342 @@ def authenticate():
         creds = flow.run_local_server(port=0)
 
         # Save tokens
-        with open(token_file, "w") as token:
-            token.write(creds.to_json())
-    logger.info("Tokens saved")
+        _save_token(creds, token_file)
+    _CREDS_CACHE["creds"] = creds
+    _CREDS_CACHE["mtime"] = token_file.stat().st_mtime
+    _start_refresher(creds, token_file)
     return creds
 
 
+def _authorized_http(creds) -> AuthorizedHttp:
+    """Create authorized HTTP client that accepts gzip-compressed responses"""
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    return set_user_agent(http, USER_AGENT)
+
+
+def _thread_http(creds) -> AuthorizedHttp:
+    """
+    Return authorized HTTP client of the current thread
+
+    httplib2 clients are not thread-safe, so every thread gets its own one
+    and requests are executed with it instead of the service's client.
+    """
+    clients = getattr(_THREAD_LOCAL, "http", None)
+    if clients is None:
+        clients = _THREAD_LOCAL.http = {}
+    http = clients.get(id(creds))
+    if http is None:
+        http = clients[id(creds)] = _authorized_http(creds)
+    return http
+
+
+def _courses_cache_file(creds) -> Path:
+    """Return course cache file of the account the credentials belong to"""
+    # Refresh token identifies the authorized user, client_id the OAuth app
+    key = f"{creds.client_id}:{creds.refresh_token or creds.token}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return COURSES_CACHE_DIR / f"courses-{digest}.json"
+
+
+def _load_courses_cache(creds, ttl: int = COURSES_CACHE_TTL) -> Optional[List[Dict]]:
+    """Return cached course list if the cache file is younger than ttl seconds"""
+    cache_file = _courses_cache_file(creds)
+    try:
+        if time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_courses_cache(creds, courses: List[Dict]) -> None:
+    """Atomically write course list to the cache file"""
+    cache_file = _courses_cache_file(creds)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(courses, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning("⚠️ Could not write courses cache: %s", e)
+
+
+def _invalidate_courses_cache(creds) -> None:
+    """Remove cached course list"""
+    try:
+        _courses_cache_file(creds).unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("⚠️ Could not remove courses cache: %s", e)
+
+
+def _is_retryable(exception) -> bool:
+    """Check whether failed request may succeed when repeated: 429/5xx or connection error"""
+    if isinstance(exception, HttpError):
+        return exception.resp.status in RETRY_STATUSES
+    # Socket timeouts and resets are OSError, failed DNS lookups HttpLib2Error
+    return isinstance(exception, (OSError, httplib2.HttpLib2Error))
+
+
+def _retry_delay(attempt: int, exception) -> float:
+    """Seconds to wait before a retry: Retry-After header or jittered exponential backoff"""
+    resp = getattr(exception, "resp", None)
+    retry_after = resp.get("retry-after", "") if resp is not None else ""
+    if retry_after.isdigit():
+        return min(int(retry_after), MAX_RETRY_DELAY)
+    return min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+
+
+class _FastJsonModel(JsonModel):
+    """JSON model that encodes and decodes request/response bodies with orjson when installed"""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        return _dumps(body_value).decode("utf-8")
+
+    def deserialize(self, content):
+        try:
+            body = _loads(content)
+        except ValueError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+@lru_cache(maxsize=None)
+def _worker_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Return shared thread pool of the given size
+
+    Pools live as long as the process, so their threads reuse HTTP clients
+    (and open connections) of _thread_http across calls.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gcroom-worker")
+
+
+@lru_cache(maxsize=4)
+def _build_service(api: str, version: str, creds):
+    """Build Google API service, shared by all instances using the same creds"""
+    # Discovery documents bundled with the client, no HTTP fetch on build
+    return build(
+        api, version, http=_thread_http(creds), model=_FastJsonModel(), static_discovery=True
+    )
+
+
 class GoogleClassroomBuild:
 
     def __init__(self):
         self.creds = authenticate()
-        self.build_services()
 
-    def build_services(self) -> None:
-        """Build Google API services"""
+    @cached_property
+    def classroom(self):
+        """Classroom API service, built on first access"""
+        return self._connect("classroom", "v1")
+
+    @cached_property
+    def classroom_service(self):
+        """Classroom courses resource"""
+        return self.classroom.courses()
+
+    @cached_property
+    def calendar_service(self):
+        """Calendar API service, built on first access"""
+        return self._connect("calendar", "v3")
+
+    def _connect(self, api: str, version: str):
+        """Build Google API service"""
         try:
-            self.classroom = build(
-                "classroom", "v1", credentials=self.creds
-            )
-            self.classroom_service = self.classroom.courses()
-            self.calendar_service = build(
-                "calendar", "v3", credentials=self.creds
-            )
-            logger.info("✅ Services connected")
+            service = _build_service(api, version, self.creds)
+            logger.info("✅ Service connected: %s %s", api, version)
+            return service
         except Exception as e:
-            logger.error(f"❌ Error connecting to services: {e}")
+            logger.error("❌ Error connecting to %s service: %s", api, e)
             raise
 
+    def execute(self, request) -> Dict:
+        """
+        Execute prepared request with the HTTP client of the current thread
+
+        Rate limit (429) and server (5xx) errors are retried with exponential
+        backoff up to NUM_RETRIES times.
+        """
+        return request.execute(http=_thread_http(self.creds), num_retries=NUM_RETRIES)
+
+    def iter_pages(self, resource, request):
+        """
+        Yield responses of paginated list request, following nextPageToken
+
+        First page is fetched in the caller's thread; every next page is
+        fetched by a long-lived background thread while the caller processes
+        the current one.
+
+        Args:
+            resource: Resource that created the request (provides list_next)
+            request: Prepared list request for the first page
+        """
+        response = self.execute(request)
+        while True:
+            request = resource.list_next(request, response)
+            if request is None:
+                yield response
+                return
+            future = _PREFETCH_EXECUTOR.submit(self.execute, request)
+            yield response
+            response = future.result()
+
+    def execute_batch(self, requests, max_workers: int = 1) -> Dict[str, Tuple]:
+        """
+        Execute requests as batch calls of up to BATCH_LIMIT requests each
+
+        Requests may come from a generator: every batch call is sent as soon
+        as BATCH_LIMIT requests are collected. Requests failed with 429/5xx
+        are resent up to NUM_RETRIES times with backoff.
+
+        Args:
+            requests: Mapping or iterable of (request ID, prepared request) pairs
+            max_workers: Number of batch calls sent concurrently
+
+        Returns:
+            Mapping of request ID to (response, exception) tuple
+        """
+        results = {}
+
+        def callback(request_id, response, exception):
+            results[request_id] = (response, exception)
+
+        def send(chunk):
+            for attempt in range(NUM_RETRIES + 1):
+                batch = self.classroom.new_batch_http_request(callback=callback)
+                for request_id, request in chunk:
+                    batch.add(request, request_id=request_id)
+                try:
+                    batch.execute(http=_thread_http(self.creds))
+                except Exception as e:
+                    if attempt == NUM_RETRIES or not _is_retryable(e):
+                        logger.error("❌ Error executing batch request: %s", e)
+                        for request_id, _ in chunk:
+                            results.setdefault(request_id, (None, e))
+                        return
+                    time.sleep(_retry_delay(attempt, e))
+                    continue
+
+                failed = [results.get(request_id, (None, None))[1] for request_id, _ in chunk]
+                chunk = [
+                    item for item, exception in zip(chunk, failed)
+                    if _is_retryable(exception)
+                ]
+                if not chunk or attempt == NUM_RETRIES:
+                    return
+                logger.warning("⚠️ Retrying %s rate limited or failed requests", len(chunk))
+                time.sleep(max(_retry_delay(attempt, e) for e in failed if _is_retryable(e)))
+
+        items = iter(requests.items() if isinstance(requests, dict) else requests)
+        chunks = iter(lambda: list(islice(items, BATCH_LIMIT)), [])
+        if max_workers > 1:
+            executor = _worker_pool(max_workers)
+            pending = deque()
+            for chunk in chunks:
+                # Wait for the oldest call first, so at most max_workers
+                # chunks of prepared requests are held at once
+                if len(pending) >= max_workers:
+                    pending.popleft().result()
+                pending.append(executor.submit(send, chunk))
+            for future in pending:
+                future.result()
+        else:
+            for chunk in chunks:
+                send(chunk)
+        return results
+
 
 class Courses(GoogleClassroomBuild):
 
-    def __init__(self, course_id_or_name=None):
+    def __init__(self, course_id_or_name=None, refresh: bool = False):
         """
         Initialize Google Classroom Courses manager
 
         Args:
-            course_id_or_name: Course id (int) or name(str)
+            course_id_or_name: Course id (int or str) or name (str)
+            refresh: Ignore locally cached course list
         """
         super().__init__()
-        
-        if isinstance(course_id_or_name, str):
-            self.get_course_by_name(course_id_or_name)
-        elif isinstance(course_id_or_name, int):
-            self.get_course_by_id(course_id_or_name)
-        else:
-            self.get_courses()
+        self.courses = []
+        self.course_id = None
+        self._by_id = {}
+        self._by_name_lower = {}
+        self._by_section_lower = {}
+        # Whether self.courses came from the disk cache and may miss new courses
+        self._courses_from_cache = False
+        self.get_courses(refresh=refresh)
+
+        if course_id_or_name is not None:
+            # Course IDs are numeric strings, so ids and names share one path
+            key = str(course_id_or_name)
+            if key not in self._by_id and key.lower() not in self._by_name_lower:
+                self._refresh_cached_courses()
+            if key in self._by_id:
+                self.get_course_by_id(key)
+            else:
+                self.get_course_by_name(key)
     
     def __call__(self):
-        try:
-            return self.courses
-        except AttributeError:
-            logger.error("❌ Courses list not set. Please initialize first.")
-            return ""
-        
+        return self.courses
+
     def __str__(self):
-        try:
-            return str(self.course_id)
-        except AttributeError:
+        if self.course_id is None:
             logger.error("❌ Course ID not set. Please call get_course_by_name or get_course_by_id first.")
             return ""
+        return str(self.course_id)
 
-    def get_courses(self) -> List[Dict]:
-        """Get list of all courses"""
+    def get_courses(
+        self, refresh: bool = False, fields: Optional[str] = COURSE_FIELDS
+    ) -> List[Dict]:
+        """
+        Get list of all courses
+
+        Args:
+            refresh: Ignore locally cached course list and query the API
+            fields: Course fields to return; by default only the ones used for
+                lookups, None for full course resources (never cached)
+
+        Returns:
+            List of courses
+        """
         try:
-            response = self.classroom_service.list(courseStates=["ACTIVE"]).execute()
-            courses = response.get("courses", [])
-            logger.info(f"📚 Found courses: {len(courses)}")
+            lookup_only = fields == COURSE_FIELDS
+            courses = None if refresh or not lookup_only else _load_courses_cache(self.creds)
+            self._courses_from_cache = courses is not None
+            if courses is None:
+                courses = []
+                params = {"courseStates": ["ACTIVE"], "pageSize": 500}
+                if fields is not None:
+                    # Partial response: only the requested course fields
+                    params["fields"] = f"nextPageToken,courses({fields})"
+                request = self.classroom_service.list(**params)
+                for response in self.iter_pages(self.classroom_service, request):
+                    courses.extend(response.get("courses", []))
+                if lookup_only:
+                    _save_courses_cache(self.creds, courses)
+            logger.info("📚 Found courses: %s", len(courses))
             self.courses = courses
+            self._by_id = {str(c["id"]): c for c in courses}
+            # Built in reverse so the first course wins on duplicate names,
+            # as with the former linear scan
+            self._by_name_lower = {
+                c.get("name", "").lower(): c for c in reversed(courses)
+            }
+            self._by_section_lower = {
+                c["section"].lower(): c for c in reversed(courses) if c.get("section")
+            }
+            return courses
         except HttpError as e:
-            logger.error(f"❌ HTTP error getting courses: {e}")
+            logger.error("❌ HTTP error getting courses: %s", e)
             return []
         except Exception as e:
-            logger.error(f"❌ Error getting courses: {e}")
+            logger.error("❌ Error getting courses: %s", e)
             return []
 
     def get_course_by_name(self, course_name: str) -> Optional[str]:
@@ -129,38 +538,76 @@ class Courses(GoogleClassroomBuild):
         Returns:
             Course ID or None
         """
-        for course in self.courses:
-            if course.get("name", "").lower() == course_name.lower():
-                logger.info(
-                    f"✅ Course: {course['name']} was foud and set as default (ID: {course['id']})"
-                )
-                self.course_id = course["id"]
-                return course["id"]
+        course = self._by_name_lower.get(course_name.lower())
+        if not course and self._refresh_cached_courses():
+            course = self._by_name_lower.get(course_name.lower())
+        if course:
+            return self._set_course(course)
 
-        logger.warning(f"⚠️ Course '{course_name}' not found")
+        logger.warning("⚠️ Course '%s' not found", course_name)
+        return None
+
+    def get_course_by_section(self, section: str) -> Optional[str]:
+        """
+        Find course ID by section
+
+        Args:
+            section: Course section
+
+        Returns:
+            Course ID or None
+        """
+        course = self._by_section_lower.get(section.lower())
+        if not course and self._refresh_cached_courses():
+            course = self._by_section_lower.get(section.lower())
+        if course:
+            return self._set_course(course)
+
+        logger.warning("⚠️ Course with section '%s' not found", section)
         return None
 
     def get_course_by_id(self, course_id: str) -> Optional[str]:
         """
-        Find course ID by name
+        Find course by ID
 
         Args:
-            course_id: Course name
+            course_id: Course ID (str or int)
 
         Returns:
             Course ID or None
         """
-        for course in self.courses:
-            if str(course.get("id", "")) == str(course_id):
-                logger.info(
-                    f"✅ Course: {course['name']} was foud and set as default (ID: {course['id']})"
-                )
-                self.course_id = course["id"]
-                return course["id"]
+        course = self._by_id.get(str(course_id))
+        if not course and self._refresh_cached_courses():
+            course = self._by_id.get(str(course_id))
+        if course:
+            return self._set_course(course)
 
-        logger.warning(f"⚠️ Course '{course_id}' not found")
+        logger.warning("⚠️ Course '%s' not found", course_id)
         return None
 
+    def _refresh_cached_courses(self) -> bool:
+        """
+        Query the API again if courses came from the disk cache
+
+        Courses created after the cache was written (e.g. in the web UI) are
+        missing from it, so a failed lookup is retried once on a fresh list.
+
+        Returns:
+            True if the course list was refreshed
+        """
+        if not self._courses_from_cache:
+            return False
+        self.get_courses(refresh=True)
+        return True
+
+    def _set_course(self, course: Dict) -> str:
+        """Set course as default and return its ID"""
+        logger.info(
+            "✅ Course: %s was foud and set as default (ID: %s)", course["name"], course["id"]
+        )
+        self.course_id = course["id"]
+        return course["id"]
+
 
 class CoursesCreation(GoogleClassroomBuild):
 
@@ -185,6 +632,7 @@ class CoursesCreation(GoogleClassroomBuild):
             Created course ID or None
         """
         super().__init__()
+        self.course_id = None
         course_data = {
             "name": name,
             "section": section,
@@ -195,29 +643,27 @@ class CoursesCreation(GoogleClassroomBuild):
         }
 
         try:
-            course = self.classroom_service.create(body=course_data).execute()
-            logger.info(f"✅ Course created: {name} (ID: {course['id']})")
+            course = self.execute(self.classroom_service.create(body=course_data))
+            logger.info("✅ Course created: %s (ID: %s)", name, course['id'])
             self.course_id = course["id"]
+            _invalidate_courses_cache(self.creds)
 
         except HttpError as e:
-            logger.error(f"❌ HTTP error creating course: {e}")
+            logger.error("❌ HTTP error creating course: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Error creating course: {e}")
+            logger.error("❌ Error creating course: %s", e)
             return None
 
     def __call__(self):
-        try:
-            return self.course_id
-        except AttributeError:
+        if self.course_id is None:
             logger.error("❌ Course ID not set. Please call create_course first.")
-            return None
-    
+        return self.course_id
+
     def __str__(self):
-        try:
-            return self.course_id
-        except AttributeError:
+        if self.course_id is None:
             return "Course not created yet"
+        return str(self.course_id)
 
 
 if __name__ == "__main__":
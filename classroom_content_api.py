@@ -1,13 +1,34 @@
+import time
+from functools import cached_property
 from googleapiclient.errors import HttpError
-from classroom_api import GoogleClassroomBuild
-from typing import List, Dict, Optional
+from classroom_api import GoogleClassroomBuild, MAX_WORKERS, _worker_pool
+from typing import Callable, List, Dict, Optional
 from logger import logger
 
+# Seconds after which cached course topics are fetched again
+TOPICS_CACHE_TTL = 600
+
+
 class Content(GoogleClassroomBuild):
 
     def __init__(self, course_id):
         super().__init__()
         self.course_id = course_id
+        # Topic name (lowercase) -> topic ID, filled on first create_topic
+        self._topics_cache: Optional[Dict[str, str]] = None
+        self._topics_cached_at = 0.0
+
+    @cached_property
+    def _announcements(self):
+        return self.classroom_service.announcements()
+
+    @cached_property
+    def _topics(self):
+        return self.classroom_service.topics()
+
+    @cached_property
+    def _materials(self):
+        return self.classroom_service.courseWorkMaterials()
 
 
     def create_announcement(
@@ -26,31 +47,23 @@ class Content(GoogleClassroomBuild):
         Returns:
             Announcement ID or None
         """
-        announcement_data = {
-            "text": text,
-            "state": "PUBLISHED",
-            "assigneeMode": "ALL_STUDENTS",
-        }
-
-        if materials:
-            announcement_data["materials"] = materials
+        announcement_data = self._announcement_body(text, materials)
 
         try:
-            response = (
-                self.classroom_service.announcements()
+            response = self.execute(
+                self._announcements
                 .create(courseId=self.course_id, body=announcement_data)
-                .execute()
             )
 
             announcement_id = response.get("id")
-            logger.info(f"✅ Announcement created with ID: {announcement_id}")
+            logger.info("✅ Announcement created with ID: %s", announcement_id)
             return announcement_id
 
         except HttpError as e:
-            logger.error(f"❌ HTTP error creating announcement: {e}")
+            logger.error("❌ HTTP error creating announcement: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Error creating announcement: {e}")
+            logger.error("❌ Error creating announcement: %s", e)
             return None
     
     def get_topics(self) -> List[Dict]:
@@ -64,20 +77,22 @@ class Content(GoogleClassroomBuild):
             List of topics
         """
         try:
-            response = (
-                self.classroom_service.topics()
-                .list(courseId=self.course_id)
-                .execute()
+            topics = []
+            request = self._topics.list(
+                courseId=self.course_id,
+                pageSize=100,
+                fields="nextPageToken,topic(topicId,name)",
             )
-            topics = response.get("topic", [])
-            logger.info(f"📚 Found {len(topics)} topics in course")
+            for response in self.iter_pages(self._topics, request):
+                topics.extend(response.get("topic", []))
+            logger.info("📚 Found %s topics in course", len(topics))
             return topics
 
         except HttpError as e:
-            logger.error(f"❌ HTTP error getting topics: {e}")
+            logger.error("❌ HTTP error getting topics: %s", e)
             return []
         except Exception as e:
-            logger.error(f"❌ Error getting topics: {e}")
+            logger.error("❌ Error getting topics: %s", e)
             return []
 
 
@@ -92,34 +107,50 @@ class Content(GoogleClassroomBuild):
         Returns:
             Topic ID or None
         """
-        topics = self.get_topics()
-  
-        for topic in topics:
-            if topic.get("name", "").lower() == topic_name.lower():
-                logger.info(
-                    f"✅ Topic already exists: {topic_name} (ID: {topic['topicId']})"
-                )
-                return topic["topicId"]
+        topics = self._cached_topics()
+
+        needle = topic_name.lower()
+        topic_id = topics.get(needle)
+        if topic_id:
+            logger.info("✅ Topic already exists: %s (ID: %s)", topic_name, topic_id)
+            return topic_id
         try:
             # Create new topic
             topic_data = {"name": topic_name}
-            response = (
-                self.classroom_service.topics()
+            response = self.execute(
+                self._topics
                 .create(courseId=self.course_id, body=topic_data)
-                .execute()
             )
 
             topic_id = response.get("topicId")
-            logger.info(f"✅ Topic created: {topic_name} (ID: {topic_id})")
+            topics[needle] = topic_id
+            logger.info("✅ Topic created: %s (ID: %s)", topic_name, topic_id)
             return topic_id
 
         except HttpError as e:
-            logger.error(f"❌ HTTP error creating topic: {e}")
+            logger.error("❌ HTTP error creating topic: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Error creating topic: {e}")
+            logger.error("❌ Error creating topic: %s", e)
             return None
 
+    def invalidate_topics(self) -> None:
+        """Drop cached topics so the next create_topic fetches them again"""
+        self._topics_cache = None
+
+    def _cached_topics(self) -> Dict[str, str]:
+        """Return topic name (lowercase) -> topic ID map, fetched when missing or stale"""
+        if (
+            self._topics_cache is None
+            or time.monotonic() - self._topics_cached_at > TOPICS_CACHE_TTL
+        ):
+            self._topics_cache = {
+                topic.get("name", "").lower(): topic["topicId"]
+                for topic in self.get_topics()
+            }
+            self._topics_cached_at = time.monotonic()
+        return self._topics_cache
+
     def create_material(
         self,
         title: str,
@@ -142,26 +173,190 @@ class Content(GoogleClassroomBuild):
         Returns:
             Material ID or None
         """
-        
-        material_data = {"title": title, "description": description, "state": state}
-        if topic_id:
-            material_data["topicId"] = topic_id
-        material_data["materials"] = materials
+        material_data = self._material_body(title, description, topic_id, materials, state)
 
         try:
-            response = (
-                self.classroom_service.courseWorkMaterials()
+            response = self.execute(
+                self._materials
                 .create(courseId=self.course_id, body=material_data)
-                .execute()
             )
 
             material_id = response.get("id")
-            logger.info(f"✅ Material created: {title} (ID: {material_id})")
+            logger.info("✅ Material created: %s (ID: %s)", title, material_id)
             return material_id
 
         except HttpError as e:
-            logger.error(f"❌ HTTP error creating material: {e}")
+            logger.error("❌ HTTP error creating material: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Error creating material: {e}")
+            logger.error("❌ Error creating material: %s", e)
             return None
+
+    def batch_create(self, items: List[Dict]) -> List[Optional[str]]:
+        """
+        Create topics, materials and announcements with batch requests
+
+        Args:
+            items: List of dicts with "type" ("topic", "material" or "announcement")
+                and the arguments of the matching create_* method
+
+        Returns:
+            List of created IDs (None for failed items) in the order of items
+        """
+        created = [None] * len(items)
+        topics = None
+        # Topic name (lowercase) -> index of the item creating it in this batch
+        new_topics = {}
+        # Index of a repeated topic item -> index of the item creating that topic
+        repeated_topics = {}
+        requests = {}
+        for index, item in enumerate(items):
+            params = dict(item)
+            item_type = params.pop("type", None)
+            if item_type == "topic":
+                if topics is None:
+                    topics = self._cached_topics()
+                needle = params["topic_name"].lower()
+                if needle in topics:
+                    logger.info(
+                        "✅ Topic already exists: %s (ID: %s)", params["topic_name"], topics[needle]
+                    )
+                    created[index] = topics[needle]
+                    continue
+                if needle in new_topics:
+                    repeated_topics[index] = new_topics[needle]
+                    continue
+                new_topics[needle] = index
+                request = self._topics.create(
+                    courseId=self.course_id, body={"name": params["topic_name"]}
+                )
+            elif item_type == "material":
+                request = self._materials.create(
+                    courseId=self.course_id, body=self._material_body(**params)
+                )
+            elif item_type == "announcement":
+                request = self._announcements.create(
+                    courseId=self.course_id, body=self._announcement_body(**params)
+                )
+            else:
+                logger.error("❌ Unknown item type: %s", item_type)
+                continue
+            requests[str(index)] = request
+
+        results = self.execute_batch(requests) if requests else {}
+
+        for request_id in requests:
+            index = int(request_id)
+            response, exception = results.get(request_id, (None, None))
+            if exception is not None:
+                logger.error("❌ HTTP error creating %s: %s", items[index].get('type'), exception)
+            if response is None:
+                continue
+            if items[index].get("type") == "topic":
+                # Materials carry topicId of their topic, so only topics fill the cache
+                topic_id = response.get("topicId")
+                topics[items[index]["topic_name"].lower()] = topic_id
+                created[index] = topic_id
+            else:
+                created[index] = response.get("id")
+        for index, first_index in repeated_topics.items():
+            created[index] = created[first_index]
+
+        failed = sum(1 for i in created if not i)
+        logger.info(
+            "📊 Batch results: %s created, %s failed", len(created) - failed, failed
+        )
+        return created
+
+    def create_topics_bulk(
+        self, topic_names: List[str], max_workers: int = MAX_WORKERS
+    ) -> List[Optional[str]]:
+        """
+        Create topics in parallel threads
+
+        Args:
+            topic_names: List of topic names
+            max_workers: Number of worker threads
+
+        Returns:
+            List of topic IDs (None for failed items) in the order of topic_names
+        """
+        # Fill the cache once, before workers start checking it
+        self._cached_topics()
+        # Names differing only in case are one topic; created once, then mapped back
+        unique_names = {}
+        for name in topic_names:
+            unique_names.setdefault(name.lower(), name)
+        topic_ids = dict(zip(
+            unique_names,
+            self._run_parallel(
+                self.create_topic,
+                [{"topic_name": name} for name in unique_names.values()],
+                max_workers,
+            ),
+        ))
+        return [topic_ids[name.lower()] for name in topic_names]
+
+    def create_materials_bulk(
+        self, items: List[Dict], max_workers: int = MAX_WORKERS
+    ) -> List[Optional[str]]:
+        """
+        Create course materials in parallel threads
+
+        Args:
+            items: List of dicts with create_material arguments
+            max_workers: Number of worker threads
+
+        Returns:
+            List of material IDs (None for failed items) in the order of items
+        """
+        return self._run_parallel(self.create_material, items, max_workers)
+
+    def create_announcements_bulk(
+        self, items: List[Dict], max_workers: int = MAX_WORKERS
+    ) -> List[Optional[str]]:
+        """
+        Create announcements in parallel threads
+
+        Args:
+            items: List of dicts with create_announcement arguments
+            max_workers: Number of worker threads
+
+        Returns:
+            List of announcement IDs (None for failed items) in the order of items
+        """
+        return self._run_parallel(self.create_announcement, items, max_workers)
+
+    @staticmethod
+    def _run_parallel(func: Callable, items: List[Dict], max_workers: int) -> List:
+        """Call func with each item as keyword arguments in a shared thread pool"""
+        executor = _worker_pool(max_workers)
+        futures = [executor.submit(func, **item) for item in items]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _announcement_body(text: str, materials: List[Dict] = None) -> Dict:
+        """Build announcement request body"""
+        announcement_data = {
+            "text": text,
+            "state": "PUBLISHED",
+            "assigneeMode": "ALL_STUDENTS",
+        }
+        if materials:
+            announcement_data["materials"] = materials
+        return announcement_data
+
+    @staticmethod
+    def _material_body(
+        title: str,
+        description: str = "",
+        topic_id: str = None,
+        materials: List[Dict] = None,
+        state: str = "PUBLISHED",
+    ) -> Dict:
+        """Build course material request body"""
+        material_data = {"title": title, "description": description, "state": state}
+        if topic_id:
+            material_data["topicId"] = topic_id
+        material_data["materials"] = materials
+        return material_data
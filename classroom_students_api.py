@@ -1,16 +1,36 @@
-from typing import List, Dict
+import csv
+from functools import cached_property
+from pathlib import Path
+from typing import Iterator, List, Dict
 
 from googleapiclient.errors import HttpError
-from classroom_api import GoogleClassroomBuild
-from fileprocessor import read_csv_json_file, write_csv_json_file
+from classroom_api import GoogleClassroomBuild, MAX_WORKERS
+from fileprocessor import iter_csv_json_file, write_csv_json_file, write_csv_rows
 from logger import logger
 
+# Partial response for students.list: student id, full name and email only
+STUDENT_FIELDS = "nextPageToken,students(userId,profile(name/fullName,emailAddress))"
+# Accepted names of the email column in student files
+EMAIL_KEYS = ("email", "Email", "student_email")
+# Columns of exported CSV; "email" keeps it readable by add_students_from_file
+EXPORT_FIELDS = ("userId", "fullName", "email")
+
+
 class Students(GoogleClassroomBuild):
 
     def __init__(self, course_id):
         super().__init__()
         self.course_id = course_id
 
+    @cached_property
+    def _students(self):
+        return self.classroom_service.students()
+
+    @cached_property
+    def _invitations(self):
+        # Invitations live on the service root, not under courses()
+        return self.classroom.invitations()
+
     def add_student(self, student_email: str) -> bool:
         """
         Add student to course
@@ -25,13 +45,7 @@ class Students(GoogleClassroomBuild):
             True if successful, False otherwise
         """
         try:
-            student_data = {"userId": student_email}
-
-            response = (
-                self.classroom_service.students()
-                .create(courseId=self.course_id, body=student_data)
-                .execute()
-            )
+            response = self.execute(self._student_request(student_email))
 
             student_name = (
                 response.get("profile", {})
@@ -48,82 +62,116 @@ class Students(GoogleClassroomBuild):
             logger.error(f"❌ Error adding student: {e}")
             raise e
 
-    def add_students_from_file(self, file_path: str, invite: bool = True) -> Dict[str, int]:
+    def add_students_from_file(
+        self, file_path: str, invite: bool = True, max_workers: int = MAX_WORKERS
+    ) -> Dict[str, int]:
         """
-        Add students from file (CSV or JSON)
+        Add students from file (CSV, JSON or NDJSON) using batch requests
 
         Args:
-            course_id: Course ID
             file_path: Path to file with students
+            invite: Send invitations instead of adding students directly
+            max_workers: Number of batch calls sent concurrently
 
         Returns:
-            Addition statistics
+            Addition statistics; "duplicates" counts emails repeated in the
+            file (sent once), "read_errors" is 1 if reading stopped at
+            malformed content, after the students read before it were sent
         """
-        stats = {"added": 0, "failed": 0, "already_exists": 0}
+        stats = {"added": 0, "failed": 0, "already_exists": 0, "duplicates": 0, "read_errors": 0}
 
-        students = read_csv_json_file(file_path)
-        if not students or students is None:
+        students = iter_csv_json_file(file_path)
+        if students is None:
             logger.warning("⚠️ No valid students found")
             return stats
-        logger.info(f"📖 Reading {len(students)} students from file")
-
-        # Add each student
-        for student in students:
-            email = (
-                student.get("email")
-                or student.get("Email")
-                    or student.get("student_email")
-                )
-
-            if not email:
-                logger.warning(f"⚠️ No email found for student: {student}")
-                stats["failed"] += 1
-                continue
-            if invite:
-                try:
-                    result = self.invite_student(email)
-                    if result:
-                       stats["added"] += 1
-                    else:
-                        stats["already_exists"] += 1
-                except Exception as e:
-                    logger.error(f"❌ Error inviting student: {e}")
+
+        def read_students():
+            try:
+                for student in students:
+                    # A JSON file holding anything but a list of objects
+                    if not isinstance(student, dict):
+                        raise ValueError("file must contain a list of student records")
+                    yield student
+            except (csv.Error, ValueError) as e:
+                logger.error(f"❌ Error reading {file_path}, remaining students skipped: {e}")
+                stats["read_errors"] += 1
+
+        def prepared_requests():
+            email_key = None
+            # Emails are batch request IDs, which must be unique
+            seen = set()
+            for student in read_students():
+                if email_key is None:
+                    # Column holding emails is picked once, from the first record
+                    email_key = next((k for k in EMAIL_KEYS if k in student), EMAIL_KEYS[0])
+                email = student.get(email_key) or self._find_email(student)
+
+                if not email:
+                    logger.warning("⚠️ No email found for student: %s", student)
                     stats["failed"] += 1
-                continue
+                    continue
+                if email.lower() in seen:
+                    logger.warning("⚠️ %s repeated in file", email)
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(email.lower())
+                if invite:
+                    yield email, self._invitation_request(email)
+                else:
+                    yield email, self._student_request(email)
+
+        results = self.execute_batch(prepared_requests(), max_workers=max_workers)
+        logger.info(f"📖 Processed {len(results) + stats['failed'] + stats['duplicates']} students from file")
+
+        added_message = "✅ Invitation sent to: %s" if invite else "✅ Student added: %s"
+        for email, (response, exception) in results.items():
+            if exception is None:
+                logger.info(added_message, email)
+                stats["added"] += 1
+            elif isinstance(exception, HttpError) and exception.resp.status == 409:
+                logger.warning("⚠️ %s already invited or in course", email)
+                stats["already_exists"] += 1
             else:
-                try:
-                    result = self.add_student(email)
-                    if result:
-                       stats["added"] += 1
-                    else:
-                        stats["already_exists"] += 1
-                except Exception as e:
-                    logger.error(f"❌ Error adding student: {e}")
-                    stats["failed"] += 1
-                continue
+                logger.error("❌ Error adding %s: %s", email, exception)
+                stats["failed"] += 1
 
         logger.info(
-            f"📊 Results: {stats['added']} added, {stats['already_exists']} already exist, {stats['failed']} failed"
+            f"📊 Results: {stats['added']} added, {stats['already_exists']} already exist, "
+            f"{stats['duplicates']} duplicates in file, {stats['failed']} failed"
+            + (" (file not read to the end)" if stats["read_errors"] else "")
         )
         return stats
-    
+
+    @staticmethod
+    def _find_email(student: Dict) -> str:
+        """Find email of a record that lacks the usual email column"""
+        for key in EMAIL_KEYS:
+            if student.get(key):
+                return student[key]
+        return ""
+
+    def _student_request(self, student_email: str):
+        """Prepare request adding student to course"""
+        return self._students.create(
+            courseId=self.course_id, body={"userId": student_email}
+        )
+
+    def _invitation_request(self, student_email: str):
+        """Prepare request inviting student to course"""
+        invitation_data = {
+            "userId": student_email,
+            "courseId": str(self.course_id),
+            "role": "STUDENT"
+        }
+        return self._invitations.create(body=invitation_data)
+
     def invite_student(self, student_email: str) -> bool:
         """
         Send invitation to student (not direct addition)
         """
         try:
-            invitation_data = {
-                "userId": student_email,
-                "courseId": str(self.course_id),
-                "role": "STUDENT"
-            }
-            
-            response = (
-                self.classroom.invitations()
-                .create(body=invitation_data)
-                .execute()
-            )
-            
+            self.execute(self._invitation_request(student_email))
+
             logger.info(f"✅ Invitation sent to: {student_email}")
             return True
             
@@ -136,6 +184,19 @@ class Students(GoogleClassroomBuild):
                 raise e
     
 
+    def iter_students(self) -> Iterator[Dict]:
+        """
+        Yield students in course page by page, as pages arrive
+
+        Raises:
+            HttpError: If a page can't be fetched
+        """
+        request = self._students.list(
+            courseId=self.course_id, pageSize=100, fields=STUDENT_FIELDS
+        )
+        for response in self.iter_pages(self._students, request):
+            yield from response.get("students", [])
+
     def get_students(self) -> List[Dict]:
         """
         Get list of students in course
@@ -147,21 +208,7 @@ class Students(GoogleClassroomBuild):
             List of students
         """
         try:
-            students = []
-            page_token = None
-
-            while True:
-                response = (
-                    self.classroom_service.students()
-                    .list(courseId=self.course_id, pageToken=page_token, pageSize=100)
-                    .execute()
-                )
-
-                students.extend(response.get("students", []))
-                page_token = response.get("nextPageToken")
-
-                if not page_token:
-                    break
+            students = list(self.iter_students())
 
             logger.info(f"👥 Found {len(students)} students in course")
             return students
@@ -184,16 +231,40 @@ class Students(GoogleClassroomBuild):
         Returns:
             True if successful, False otherwise
         """
+        if Path(output_file).suffix.lower() != ".csv":
+            students = self.get_students()
+            if not students:
+                logger.warning("⚠️ No students found to export")
+                return False
+            out = write_csv_json_file(output_file, students)
+        else:
+            # Rows are written as pages arrive, without buffering the roster;
+            # output_file is replaced only after the last page was written
+            rows = (self._student_row(student) for student in self.iter_students())
+            try:
+                out = write_csv_rows(output_file, rows, EXPORT_FIELDS)
+            except HttpError as e:
+                logger.error(f"❌ HTTP error getting students: {e}")
+                return False
+            except Exception as e:
+                logger.error(f"❌ Error getting students: {e}")
+                return False
+            if out == 0:
+                logger.warning("⚠️ No students found to export")
+                return False
 
-        students = self.get_students()
-
-        if not students:
-            logger.warning("⚠️ No students found to export")
-            return False
-        
-        out = write_csv_json_file(output_file, students)
         if not out:
             logger.error(f"❌ Error writing to file: {output_file}")
             return False
         logger.info(f"✅ Students exported to {output_file}")
-        return True
\ No newline at end of file
+        return True
+
+    @staticmethod
+    def _student_row(student: Dict) -> Dict:
+        """Flatten student resource into export CSV row"""
+        profile = student.get("profile", {})
+        return {
+            "userId": student.get("userId"),
+            "fullName": profile.get("name", {}).get("fullName"),
+            "email": profile.get("emailAddress"),
+        }
\ No newline at end of file
@@ -1,9 +1,15 @@
 import jwt
 import os
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from fileprocessor import _dumps, _loads
+from logger import logger
 
 # Load credentials from .env file
 load_dotenv()
@@ -12,21 +18,43 @@ API_KEY = os.getenv("ZOOM_API_KEY")
 API_SECRET = os.getenv("ZOOM_API_SECRET")
 USER_ID = os.getenv("ZOOM_USER_ID", "me")
 
+# Shared session keeps connections to api.zoom.us alive between calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.headers.update({'content-type': 'application/json'})
+# JWT lifetime and how long before expiry a new one is signed, seconds
+JWT_TTL = 3600
+JWT_REFRESH_MARGIN = 60
+# Last signed JWT and its expiry timestamp
+_JWT_CACHE = {"token": None, "exp": 0}
+_JWT_LOCK = threading.Lock()
+
+
 def generate_jwt():
-    payload = {
-        'iss': API_KEY,
-        'exp': time.time() + 3600  # valid for 1 hour
-    }
-    token = jwt.encode(payload, API_SECRET, algorithm='HS256')
-    return token
+    # Reuse the signed token until shortly before it expires
+    with _JWT_LOCK:
+        if _JWT_CACHE["token"] and time.time() < _JWT_CACHE["exp"] - JWT_REFRESH_MARGIN:
+            return _JWT_CACHE["token"]
+        payload = {
+            'iss': API_KEY,
+            'exp': time.time() + JWT_TTL
+        }
+        token = jwt.encode(payload, API_SECRET, algorithm='HS256')
+        _JWT_CACHE["token"] = token
+        _JWT_CACHE["exp"] = payload["exp"]
+        return token
 
-def schedule_zoom_meeting(topic="Test Meeting", start_time=None, duration=60):
+def schedule_zoom_meeting(topic="Test Meeting", start_time=None, duration=60,
+                          start_offset_minutes=10, base_time=None):
     if start_time is None:
-        start_time = (datetime.now(timezone.utc) + timedelta(minutes=10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Relative start: base_time (now by default) plus the offset, in UTC
+        if base_time is None:
+            base_time = datetime.now(timezone.utc).replace(microsecond=0)
+        start = base_time + timedelta(minutes=start_offset_minutes)
+        start_time = start.isoformat(timespec="seconds").replace("+00:00", "Z")
 
     headers = {
-        'authorization': f'Bearer {generate_jwt()}',
-        'content-type': 'application/json'
+        'authorization': f'Bearer {generate_jwt()}'
     }
 
     payload = {
@@ -42,21 +70,41 @@ def schedule_zoom_meeting(topic="Test Meeting", start_time=None, duration=60):
         }
     }
 
-    response = requests.post(
+    response = _SESSION.post(
         f'https://api.zoom.us/v2/users/{USER_ID}/meetings',
         headers=headers,
-        json=payload
+        data=_dumps(payload)
     )
 
     if response.status_code == 201:
-        meeting = response.json()
-        print("Meeting created successfully!")
-        print("Join URL:", meeting["join_url"])
-        print("Start URL:", meeting["start_url"])
-    else:
-        print("Error:", response.status_code)
-        print(response.text)
+        meeting = _loads(response.content)
+        logger.info("✅ Meeting created: %s (join URL: %s)", topic, meeting["join_url"])
+        return meeting
+    logger.error("❌ Error creating meeting: %s %s", response.status_code, response.text)
+    return None
+
+def schedule_many(meetings, max_workers=16):
+    """
+    Schedule several meetings concurrently over the shared session.
+
+    Args:
+        meetings: List of dicts with schedule_zoom_meeting arguments
+        max_workers: Number of meetings created at the same time
+
+    Returns:
+        List of schedule_zoom_meeting results in the order of meetings
+    """
+    # One clock read shared by all meetings scheduled relative to now
+    base_time = datetime.now(timezone.utc).replace(microsecond=0)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(schedule_zoom_meeting, **{"base_time": base_time, **meeting})
+            for meeting in meetings
+        ]
+        return [future.result() for future in futures]
 
 if __name__ == "__main__":
     # Example usage
-    schedule_zoom_meeting(topic="Project Sync", duration=45)
+    meeting = schedule_zoom_meeting(topic="Project Sync", duration=45)
+    if meeting:
+        logger.info("Start URL: %s", meeting["start_url"])
@@ -1,58 +1,214 @@
+import codecs
 import csv
 import json
+import mmap
+import os
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used without it
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Buffer of text files, larger than the default 8 KiB to cut read/write syscalls
+BUFFER_SIZE = 1 << 20
+# Bytes checked for valid UTF-8 before a file is parsed
+SNIFF_SIZE = 4096
+
+
+def _dumps(data):
+    """Encodes data as JSON bytes, with orjson when it is installed."""
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+
+
+def _loads(content):
+    """Decodes JSON from str or bytes, with orjson when it is installed."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
 
 def read_csv_json_file(file_path):
     """
-    Reads the content of a CSV or JSON file and returns it as a list of dictionaries.
+    Reads the content of a CSV, JSON or NDJSON file and returns it as a list of dictionaries.
     
     Args:
         file_path (str): The path to the file to be read.
         
     Returns:
-        list: The content of the file.
+        list: The content of the file, or None if the file can't be read.
+            A JSON file is returned as parsed, whatever its top-level value.
+    """
+    file_path = Path(file_path)
+    reader = _reader_for(file_path)
+    if reader is None:
+        return None
+    try:
+        if reader is _iter_json:
+            return _load_json(file_path)
+        return list(reader(file_path))
+    except (csv.Error, ValueError) as e:
+        logger.error(f"❌ Error reading file {file_path}: {e}")
+        return None
+
+
+def _is_utf8(file_path):
+    """
+    Checks the beginning of a file for valid UTF-8, so bad input fails before parsing.
+
+    Args:
+        file_path (Path): The path to the file to be checked.
+
+    Returns:
+        bool: True if the first SNIFF_SIZE bytes are valid UTF-8.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_SIZE)
+    try:
+        # Incremental decoder tolerates a multi-byte character cut at the end
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return True
+    except UnicodeDecodeError as e:
+        guess = ""
+        try:
+            from charset_normalizer import from_bytes
+            match = from_bytes(head).best()
+            if match is not None:
+                guess = f" (looks like {match.encoding})"
+        except ImportError:
+            pass
+        logger.error(f"❌ File is not UTF-8 encoded{guess}: {file_path}: {e}")
+        return False
+
+
+def iter_csv_json_file(file_path):
+    """
+    Lazily reads a CSV, JSON or NDJSON (one JSON record per line) file,
+    yielding its records one by one.
+
+    Args:
+        file_path (str): The path to the file to be read.
+
+    Returns:
+        iterator: Records of the file as dictionaries, or None if the file
+            doesn't exist or its format is not supported. Items of a JSON file
+            are not checked to be dictionaries.
+
+    Raises:
+        csv.Error, ValueError: While iterating, when malformed content (or
+            invalid UTF-8 past the checked beginning) is reached.
     """
     file_path = Path(file_path)
-            
+    reader = _reader_for(file_path)
+    if reader is None:
+        return None
+    return reader(file_path)
+
+
+def _reader_for(file_path):
+    """
+    Picks the record reader of a file by its extension.
+
+    Args:
+        file_path (Path): The path to the file to be read.
+
+    Returns:
+        callable: The reader, or None if the file doesn't exist, its format
+            is not supported or it is not UTF-8 encoded.
+    """
     if not file_path.exists():
         logger.error(f"❌ File not found: {file_path}")
         return None
-    
-    content = []
-    
+
     # Read file based on extension
-    if file_path.suffix.lower() == '.csv':
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                content = [row for row in reader]
-        except csv.Error as e:
-            logger.error(f"❌ Error reading CSV file: {e}")
-            return None
-    elif file_path.suffix.lower() == '.json':
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Error reading JSON file: {e}")
-            return None
-    else:
+    reader = _READERS.get(file_path.suffix.lower())
+    if reader is None:
         logger.error(f"❌ Unsupported file format: {file_path.suffix}")
         return None
+    if not _is_utf8(file_path):
+        return None
+    return reader
+
+
+def _iter_csv(file_path):
+    with open(file_path, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        yield from _dict_rows(csv.reader(f))
+
+
+def _dict_rows(reader):
+    """
+    Same rows as csv.DictReader, built with less per-row overhead.
+
+    Rows matching the header take a single dict(zip()) call; short or long
+    rows are padded with None or keep extra values under the None key, as
+    DictReader does.
+    """
+    fieldnames = next(reader, None)
+    if fieldnames is None:
+        return
+    width = len(fieldnames)
+    for row in reader:
+        if not row:
+            continue
+        if len(row) == width:
+            yield dict(zip(fieldnames, row))
+        else:
+            record = dict(zip(fieldnames, row))
+            if len(row) > width:
+                record[None] = row[width:]
+            else:
+                for key in fieldnames[len(row):]:
+                    record[key] = None
+            yield record
+
+
+def _iter_json(file_path):
+    yield from _load_json(file_path)
+
+
+def _load_json(file_path):
+    if orjson is not None and file_path.stat().st_size:
+        # Parse straight from the memory-mapped file, without copying it to bytes
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            content = orjson.loads(view)
+    else:
+        with open(file_path, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+            content = json.load(f)
     return content
 
 
-def write_csv_json_file(file_path, data):
+def _iter_ndjson(file_path):
+    # One JSON record per line, so only the current record is held in memory
+    with open(file_path, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid NDJSON record at line {line_number}: {e}") from e
+            yield record
+
+
+_READERS = {
+    '.csv': _iter_csv,
+    '.json': _iter_json,
+    '.ndjson': _iter_ndjson,
+    '.jsonl': _iter_ndjson,
+}
+
+
+def write_csv_json_file(file_path, data, pretty=False):
     """
     Writes a list of dictionaries to a CSV or JSON file.
     
     Args:
         file_path (str): The path to the file to be written.
         data (list): The data to be written to the file.
+        pretty (bool): Indent JSON output; compact JSON is smaller and faster to write.
         
     Returns:
         bool: True if the file was written successfully, False otherwise.
@@ -64,24 +220,96 @@ def write_csv_json_file(file_path, data):
         return False
     
     # Write file based on extension
-    if file_path.suffix.lower() == '.csv':
+    writer = _WRITERS.get(file_path.suffix.lower())
+    if writer is None:
+        logger.error(f"❌ Unsupported file format: {file_path.suffix}")
+        return False
+    return writer(file_path, data, pretty)
+
+
+def _write_csv(file_path, data, pretty):
+    try:
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+            fields = list(data[0].keys())
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows([row.get(k, "") for k in fields] for row in data)
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error writing CSV file: {e}")
+        return False
+
+
+def _write_json(file_path, data, pretty):
+    try:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+        elif pretty:
+            with open(file_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+        else:
+            with open(file_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error writing JSON file: {e}")
+        return False
+
+
+_WRITERS = {'.csv': _write_csv, '.json': _write_json}
+
+
+def write_csv_rows(file_path, rows, fieldnames):
+    """
+    Writes dictionaries to a CSV file as they are produced by an iterable.
+
+    Rows go to a temporary file that replaces file_path only when at least
+    one row was written, so an empty or failed run leaves file_path as it was.
+
+    Args:
+        file_path (str): The path to the file to be written.
+        rows (iterable): Dictionaries to be written, e.g. a generator.
+        fieldnames (list): CSV columns; missing keys are written empty.
+
+    Returns:
+        int: Number of rows written, or None if writing failed.
+
+    Raises:
+        Exception: Errors raised by rows are passed on to the caller.
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    rows = iter(rows)
+    rows_error = None
+    count = 0
+    try:
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-            return True
-        except Exception as e:
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                while True:
+                    # Errors of rows (e.g. network errors of API calls) are kept
+                    # apart from write errors and re-raised once the file is closed
+                    try:
+                        row = next(rows)
+                    except StopIteration:
+                        break
+                    except Exception as e:
+                        rows_error = e
+                        break
+                    writer.writerow([row.get(k, "") for k in fieldnames])
+                    count += 1
+            if rows_error is None and count:
+                os.replace(tmp_path, file_path)
+        except (OSError, csv.Error) as e:
             logger.error(f"❌ Error writing CSV file: {e}")
-            return False
-    elif file_path.suffix.lower() == '.json':
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            return True
-        except Exception as e:
-            logger.error(f"❌ Error writing JSON file: {e}")
-            return False
-    else:
-        logger.error(f"❌ Unsupported file format: {file_path.suffix}")
-        return False
\ No newline at end of file
+            return None
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    if rows_error is not None:
+        raise rows_error
+    return count
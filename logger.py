@@ -1,18 +1,30 @@
+import atexit
 import logging
+import queue
 import sys
-import io
-import codecs
+from logging.handlers import QueueHandler, QueueListener
 
-# Override stdout and stderr to support UTF-8
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
-utf8_stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-file_handler = logging.FileHandler("google_class.log", encoding="utf8")
+# Switch stdout and stderr to UTF-8 only where they use another encoding
+for stream in (sys.stdout, sys.stderr):
+    if (stream.encoding or "").lower() not in ("utf-8", "utf8") and hasattr(stream, "reconfigure"):
+        stream.reconfigure(encoding="utf-8")
+file_handler = logging.FileHandler("google_class.log", encoding="utf-8", delay=True)
+stream_handler = logging.StreamHandler(sys.stdout)
+formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+file_handler.setFormatter(formatter)
+stream_handler.setFormatter(formatter)
+
+# Records are only enqueued by the caller; a background thread writes them out
+log_queue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+listener = QueueListener(log_queue, file_handler, stream_handler)
+listener.start()
+atexit.register(listener.stop)
 
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[file_handler, logging.StreamHandler(utf8_stdout)],
+    handlers=[queue_handler],
 )
 logger = logging.getLogger(__name__)
\ No newline at end of file
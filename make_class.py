@@ -24,10 +24,10 @@ def create_classroom():
 
 def get_course_ids():
     """
-    Get the IDs of the created courses.
+    Get the created courses with all their fields.
     """
     course = Courses()
-    return course()
+    return course.get_courses(fields=None)
 
 
 if __name__ == "__main__":
@@ -36,8 +36,7 @@ if __name__ == "__main__":
     # # 770249109796
     c_list = get_course_ids()
     for c in c_list:
-        for k,v in c.items():
-            logger.info(f"{k}: {v}")
+        logger.info("\n".join(f"{k}: {v}" for k, v in c.items()))
 
     # You can add more functionality here, such as creating topics, adding students, etc.
     # For example:
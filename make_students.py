@@ -1,15 +1,12 @@
 from classroom_students_api import Students
 
-def add_students_to_classroom(course_id, file_path):
+def add_students_to_classroom(students, file_path):
     """
     Invite students to a Google Classroom course.
 
-    :param course_id: The ID of the course to which students will be added.
+    :param students: Students manager of the course to which students will be added.
     :param file_path: The path to the file containing student email addresses.
     """
-    # Create an instance of the Students class
-    students = Students(course_id=course_id)
-
     # Read student emails from the file
     students.add_students_from_file(file_path)
 
@@ -23,5 +20,5 @@ if __name__ == "__main__":
     print(f"Now course {course_id} has {len(current_students)} students")
 
     # Invite students to the course
-    add_students_to_classroom(course_id, student_file_path)
+    add_students_to_classroom(students, student_file_path)
     print(f"Students invited to course {course_id} from {student_file_path}.")
\ No newline at end of file